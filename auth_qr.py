@@ -3,17 +3,27 @@
 import asyncio
 import qrcode
 from telethon import TelegramClient
-from telethon.tl.functions.auth import ExportLoginTokenRequest, ImportLoginTokenRequest
-from telethon.tl.types import auth
+from telethon.errors import SessionPasswordNeededError
 from dotenv import load_dotenv
 import os
-import base64
 
 load_dotenv()
 
 API_ID = int(os.getenv("TELEGRAM_API_ID"))
 API_HASH = os.getenv("TELEGRAM_API_HASH")
 
+
+def print_qr(url: str) -> None:
+    """Print login URL as an ASCII QR code."""
+    qr = qrcode.QRCode(version=1, box_size=2, border=1)
+    qr.add_data(url)
+    qr.make(fit=True)
+    
+    print("\nScan this QR code with Telegram on your phone:")
+    print("(Settings → Devices → Link Desktop Device)\n")
+    qr.print_ascii(invert=True)
+
+
 async def main():
     print("QR Code Authorization")
     print("=" * 40)
@@ -27,59 +37,25 @@ async def main():
         await client.disconnect()
         return
     
-    # Request QR login token
-    qr_login = await client(ExportLoginTokenRequest(
-        api_id=API_ID,
-        api_hash=API_HASH,
-        except_ids=[]
-    ))
-    
-    # Generate QR code
-    token_url = f"tg://login?token={base64.urlsafe_b64encode(qr_login.token).decode('utf-8').rstrip('=')}"
-    
-    qr = qrcode.QRCode(version=1, box_size=2, border=1)
-    qr.add_data(token_url)
-    qr.make(fit=True)
-    
-    print("\nScan this QR code with Telegram on your phone:")
-    print("(Settings → Devices → Link Desktop Device)\n")
-    qr.print_ascii(invert=True)
-    
-    print("\nWaiting for authorization...")
+    # Request QR login token; Telethon pushes UpdateLoginToken on scan,
+    # so we wait for that event instead of polling the server
+    qr_login = await client.qr_login()
     
-    # Wait for user to scan
     while True:
-        await asyncio.sleep(2)
+        print_qr(qr_login.url)
+        print("\nWaiting for authorization...")
+        
         try:
-            qr_login = await client(ExportLoginTokenRequest(
-                api_id=API_ID,
-                api_hash=API_HASH,
-                except_ids=[]
-            ))
-            
-            if isinstance(qr_login, auth.LoginTokenSuccess):
-                break
-            elif isinstance(qr_login, auth.LoginTokenMigrateTo):
-                # Need to reconnect to another DC
-                await client._switch_dc(qr_login.dc_id)
-                qr_login = await client(ImportLoginTokenRequest(qr_login.token))
-                if isinstance(qr_login, auth.LoginTokenSuccess):
-                    break
-        except Exception as e:
-            if "TIMEOUT" in str(e) or "expired" in str(e).lower():
-                print("QR expired, generating new one...")
-                qr_login = await client(ExportLoginTokenRequest(
-                    api_id=API_ID,
-                    api_hash=API_HASH,
-                    except_ids=[]
-                ))
-                token_url = f"tg://login?token={base64.urlsafe_b64encode(qr_login.token).decode('utf-8').rstrip('=')}"
-                qr = qrcode.QRCode(version=1, box_size=2, border=1)
-                qr.add_data(token_url)
-                qr.make(fit=True)
-                qr.print_ascii(invert=True)
-            else:
-                raise
+            # Waits until the token expires, no repeated token requests
+            await qr_login.wait()
+            break
+        except asyncio.TimeoutError:
+            print("QR expired, generating new one...")
+            await qr_login.recreate()
+        except SessionPasswordNeededError:
+            password = input("Two-factor auth enabled. Enter password: ")
+            await client.sign_in(password=password)
+            break
     
     me = await client.get_me()
     print(f"\n✅ Authorized as: {me.first_name} (@{me.username})")
@@ -1,138 +1,132 @@
 """Admin handlers for parsing and export."""
 
 import asyncio
-import json
 import logging
+from functools import lru_cache
+from pathlib import Path
 
-from aiogram import Router, F
-from aiogram.types import CallbackQuery, BufferedInputFile
-from sqlalchemy import select
+from aiogram import Bot, Router, F
+from aiogram.types import CallbackQuery, FSInputFile
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from bot.keyboards import get_result_keyboard, get_back_keyboard, get_main_keyboard
-from core.config import get_settings, load_chats_config
 from core.database import get_async_session
-from core.models import ParseLog
-from worker.jobs.parser import ChatParser
-from worker.telethon_client import get_telethon_client
+from core.models import ParseLog, utcnow
+from services.parse_log_service import (
+    ParseLogService,
+    ParseLogSnapshot,
+    remember_parse_log,
+)
+from worker.jobs.export_job import run_parse_into_export
 
 router = Router()
 logger = logging.getLogger(__name__)
 
+NO_EXPORT_TEXT = "❌ Нет данных для экспорта"
+NO_STATUS_TEXT = "📊 Статус\n\n❌ Парсинг ещё не запускался"
+PARSING_IN_PROGRESS_TEXT = "⏳ Парсинг ещё идёт, подожди..."
+
+# Let Telegram clients reuse these answers instead of re-sending the query
+NO_DATA_CACHE_TIME = 10
+
+# Held for the whole background parsing run started from the bot
+_parsing_lock = asyncio.Lock()
+
 
 @router.callback_query(F.data == "start_parsing")
-async def start_parsing(callback: CallbackQuery, session: AsyncSession):
+async def start_parsing(callback: CallbackQuery, bot: Bot):
     """Start parsing process."""
-    await callback.message.edit_text(
-        "⏳ Начинаю парсинг...\n\n"
-        "Это займёт 20-30 минут.\n"
-        "Я отправлю уведомление когда закончу."
-    )
-    await callback.answer()
+    # Repeated taps while a run is in progress must not start another one
+    if _parsing_lock.locked():
+        await callback.answer(PARSING_IN_PROGRESS_TEXT)
+        return
+    
+    # Uncontended acquire does not yield, so concurrent taps see it as busy;
+    # released by run_parsing_task when the run is over
+    await _parsing_lock.acquire()
+    
+    try:
+        await callback.message.edit_text(
+            "⏳ Начинаю парсинг...\n\n"
+            "Это займёт 20-30 минут.\n"
+            "Я отправлю уведомление когда закончу."
+        )
+        await callback.answer()
+    except Exception:
+        _parsing_lock.release()
+        raise
     
     # Run parsing in background
-    asyncio.create_task(run_parsing_task(callback.from_user.id, callback.message))
+    asyncio.create_task(run_parsing_task(bot, callback.from_user.id, callback.message))
 
 
-async def run_parsing_task(user_id: int, message):
-    """Background task for parsing."""
-    from datetime import datetime
-    from aiogram import Bot
-    
-    settings = get_settings()
-    bot = Bot(token=settings.BOT_TOKEN)
-    
+async def run_parsing_task(bot: Bot, user_id: int, message):
+    """Background task for parsing.
+
+    Uses the dispatcher's Bot so notifications go through its pooled
+    HTTP session instead of opening a new one per run.
+    """
+    try:
+        await _run_parsing(bot, user_id, message)
+    finally:
+        if _parsing_lock.locked():
+            _parsing_lock.release()
+
+
+async def _run_parsing(bot: Bot, user_id: int, message):
+    """Run parsing, save the export and report the result to the user."""
     async_session = get_async_session()
     async with async_session() as session:
-        log = ParseLog(status="running")
+        # started_at is set here so the row does not have to be read back
+        log = ParseLog(status="running", started_at=utcnow())
         session.add(log)
         await session.commit()
-        await session.refresh(log)
-        
-        total_chats = 0
-        total_messages = 0
+        remember_parse_log(log)
         
         try:
-            config = load_chats_config()
-            chat_ids = config.get("chats", [])
-            parse_days = config.get("settings", {}).get("parse_days", 2)
-            
-            client = await get_telethon_client()
-            parser = ChatParser(client)
-            
-            messages = await parser.parse_all_chats(chat_ids, days=parse_days)
-            total_chats = len(chat_ids)
-            total_messages = len(messages)
-            
-            export_data = {
-                "parsed_at": datetime.now().isoformat(),
-                "parse_days": parse_days,
-                "chats_count": total_chats,
-                "messages_count": total_messages,
-                "messages": messages,
-            }
-            
-            json_data = json.dumps(export_data, ensure_ascii=False)
-            
-            log.finished_at = datetime.utcnow()
-            log.status = "success"
-            log.chats_parsed = total_chats
-            log.messages_found = total_messages
-            log.json_data = json_data
-            await session.commit()
-            
-            # Notify user
-            size_mb = len(json_data.encode('utf-8')) / (1024 * 1024)
-            await bot.edit_message_text(
-                chat_id=user_id,
-                message_id=message.message_id,
-                text=(
-                    f"✅ Парсинг завершён!\n\n"
-                    f"📁 Чатов: {total_chats}\n"
-                    f"💬 Сообщений: {total_messages}\n"
-                    f"📦 Размер: {size_mb:.1f} MB\n\n"
-                    f"Нажми кнопку чтобы скачать:"
-                ),
-                reply_markup=get_result_keyboard()
-            )
-            
+            export = await run_parse_into_export(session, log)
         except Exception as e:
-            logger.error(f"Parsing failed: {e}")
-            log.finished_at = datetime.utcnow()
-            log.status = "failed"
-            log.error_message = str(e)
-            await session.commit()
-            
+            remember_parse_log(log)
             await bot.edit_message_text(
                 chat_id=user_id,
                 message_id=message.message_id,
                 text=f"❌ Ошибка парсинга:\n{str(e)}",
                 reply_markup=get_back_keyboard()
             )
-        finally:
-            await bot.session.close()
+            return
+        
+        remember_parse_log(log)
+        
+        # Notify user
+        size_mb = export.size / (1024 * 1024)
+        await bot.edit_message_text(
+            chat_id=user_id,
+            message_id=message.message_id,
+            text=(
+                f"✅ Парсинг завершён!\n\n"
+                f"📁 Чатов: {log.chats_parsed}\n"
+                f"💬 Сообщений: {log.messages_found}\n"
+                f"📦 Размер: {size_mb:.1f} MB\n\n"
+                f"Нажми кнопку чтобы скачать:"
+            ),
+            reply_markup=get_result_keyboard()
+        )
 
 
 @router.callback_query(F.data == "get_json")
 async def get_json(callback: CallbackQuery, session: AsyncSession):
     """Send JSON file to user."""
-    result = await session.execute(
-        select(ParseLog)
-        .where(ParseLog.status == "success")
-        .where(ParseLog.json_data.isnot(None))
-        .order_by(ParseLog.started_at.desc())
-        .limit(1)
-    )
-    last_log = result.scalar_one_or_none()
+    last_log = await ParseLogService(session).get_latest(success_only=True)
     
-    if not last_log or not last_log.json_data:
-        await callback.answer("❌ Нет данных для экспорта", show_alert=True)
+    if not last_log or not Path(last_log.json_path).is_file():
+        await callback.answer(
+            NO_EXPORT_TEXT, show_alert=True, cache_time=NO_DATA_CACHE_TIME
+        )
         return
     
     try:
-        json_bytes = last_log.json_data.encode('utf-8')
         filename = f"crypto_{last_log.started_at.strftime('%Y%m%d_%H%M%S')}.json"
-        document = BufferedInputFile(json_bytes, filename=filename)
+        document = FSInputFile(last_log.json_path, filename=filename)
         
         await callback.message.answer_document(
             document,
@@ -148,41 +142,58 @@ async def get_json(callback: CallbackQuery, session: AsyncSession):
         await callback.answer(f"❌ Ошибка: {str(e)}", show_alert=True)
 
 
+@lru_cache(maxsize=32)
+def format_status_text(log: ParseLogSnapshot) -> str:
+    """Render status text for a parse log snapshot.
+
+    Snapshots are immutable and change on every state transition, so
+    repeated status polls of the same run reuse the rendered text.
+    """
+    status_emoji = "✅" if log.status == "success" else "⏳" if log.status == "running" else "❌"
+    status_text = {
+        "success": "Завершён",
+        "running": "В процессе",
+        "failed": "Ошибка"
+    }.get(log.status, log.status)
+    
+    return (
+        f"📊 Статус последнего парсинга\n\n"
+        f"{status_emoji} Статус: {status_text}\n"
+        f"📅 Начало: {log.started_at.strftime('%d.%m.%Y %H:%M')}\n"
+        f"📁 Чатов: {log.chats_parsed}\n"
+        f"💬 Сообщений: {log.messages_found}"
+    )
+
+
 @router.callback_query(F.data == "status")
 async def show_status(callback: CallbackQuery, session: AsyncSession):
     """Show last parse status."""
-    result = await session.execute(
-        select(ParseLog).order_by(ParseLog.started_at.desc()).limit(1)
-    )
-    last_log = result.scalar_one_or_none()
+    last_log = await ParseLogService(session).get_latest()
     
     if not last_log:
         await callback.message.edit_text(
-            "📊 Статус\n\n❌ Парсинг ещё не запускался",
+            NO_STATUS_TEXT,
             reply_markup=get_back_keyboard()
         )
         await callback.answer()
         return
     
-    status_emoji = "✅" if last_log.status == "success" else "⏳" if last_log.status == "running" else "❌"
-    status_text = {
-        "success": "Завершён",
-        "running": "В процессе",
-        "failed": "Ошибка"
-    }.get(last_log.status, last_log.status)
-    
-    text = (
-        f"📊 Статус последнего парсинга\n\n"
-        f"{status_emoji} Статус: {status_text}\n"
-        f"📅 Начало: {last_log.started_at.strftime('%d.%m.%Y %H:%M')}\n"
-        f"📁 Чатов: {last_log.chats_parsed}\n"
-        f"💬 Сообщений: {last_log.messages_found}"
-    )
+    text = format_status_text(last_log)
     
-    if last_log.status == "success" and last_log.json_data:
-        await callback.message.edit_text(text, reply_markup=get_result_keyboard())
+    # The export may have been written on another host or already removed
+    if (
+        last_log.status == "success"
+        and last_log.json_path
+        and Path(last_log.json_path).is_file()
+    ):
+        keyboard = get_result_keyboard()
     else:
-        await callback.message.edit_text(text, reply_markup=get_back_keyboard())
+        keyboard = get_back_keyboard()
+    
+    # Repeated taps on an unchanged status would only produce
+    # "message is not modified" errors, so skip the edit call
+    if callback.message.text != text or callback.message.reply_markup != keyboard:
+        await callback.message.edit_text(text, reply_markup=keyboard)
     
     await callback.answer()
 
@@ -190,4 +201,4 @@ async def show_status(callback: CallbackQuery, session: AsyncSession):
 @router.callback_query(F.data == "parsing_status")
 async def parsing_status(callback: CallbackQuery):
     """Handle click on parsing status button."""
-    await callback.answer("⏳ Парсинг ещё идёт, подожди...")
+    await callback.answer(PARSING_IN_PROGRESS_TEXT, cache_time=NO_DATA_CACHE_TIME)
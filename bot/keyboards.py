@@ -1,37 +1,53 @@
-"""Keyboard builders for the Telegram bot."""
+"""Keyboard builders for the Telegram bot.
 
-from aiogram.types import InlineKeyboardButton, InlineKeyboardMarkup
+Keyboards are static, so each one is built once at import time and the
+same instance is returned on every call.
+"""
 
+from aiogram.types import InlineKeyboardButton, InlineKeyboardMarkup
 
-def get_main_keyboard() -> InlineKeyboardMarkup:
-    """Main menu keyboard."""
-    buttons = [
+_MAIN_KEYBOARD = InlineKeyboardMarkup(
+    inline_keyboard=[
         [InlineKeyboardButton(text="🚀 Начать парсинг", callback_data="start_parsing")],
         [InlineKeyboardButton(text="📊 Статус", callback_data="status")],
     ]
-    return InlineKeyboardMarkup(inline_keyboard=buttons)
+)
+
+_PARSING_KEYBOARD = InlineKeyboardMarkup(
+    inline_keyboard=[
+        [InlineKeyboardButton(text="⏳ Парсинг идёт...", callback_data="parsing_status")],
+    ]
+)
+
+_RESULT_KEYBOARD = InlineKeyboardMarkup(
+    inline_keyboard=[
+        [InlineKeyboardButton(text="📥 Получить JSON", callback_data="get_json")],
+        [InlineKeyboardButton(text="🔄 Новый парсинг", callback_data="start_parsing")],
+    ]
+)
+
+_BACK_KEYBOARD = InlineKeyboardMarkup(
+    inline_keyboard=[
+        [InlineKeyboardButton(text="🔙 Назад", callback_data="back_to_main")],
+    ]
+)
+
+
+def get_main_keyboard() -> InlineKeyboardMarkup:
+    """Main menu keyboard."""
+    return _MAIN_KEYBOARD
 
 
 def get_parsing_keyboard() -> InlineKeyboardMarkup:
     """Keyboard shown during parsing."""
-    buttons = [
-        [InlineKeyboardButton(text="⏳ Парсинг идёт...", callback_data="parsing_status")],
-    ]
-    return InlineKeyboardMarkup(inline_keyboard=buttons)
+    return _PARSING_KEYBOARD
 
 
 def get_result_keyboard() -> InlineKeyboardMarkup:
     """Keyboard shown after parsing completes."""
-    buttons = [
-        [InlineKeyboardButton(text="📥 Получить JSON", callback_data="get_json")],
-        [InlineKeyboardButton(text="🔄 Новый парсинг", callback_data="start_parsing")],
-    ]
-    return InlineKeyboardMarkup(inline_keyboard=buttons)
+    return _RESULT_KEYBOARD
 
 
 def get_back_keyboard() -> InlineKeyboardMarkup:
     """Back to main menu keyboard."""
-    buttons = [
-        [InlineKeyboardButton(text="🔙 Назад", callback_data="back_to_main")],
-    ]
-    return InlineKeyboardMarkup(inline_keyboard=buttons)
+    return _BACK_KEYBOARD
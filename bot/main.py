@@ -2,15 +2,23 @@
 
 import asyncio
 import logging
+from typing import Any
 
+import orjson
 from aiogram import Bot, Dispatcher
-from aiogram.fsm.storage.memory import MemoryStorage
-from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine, async_sessionmaker
+from aiogram.client.session.aiohttp import AiohttpSession
+from sqlalchemy.ext.asyncio import async_sessionmaker
 
 from core.config import get_settings
-from core.models import Base
+from core.database import close_db, get_async_session, init_db
 from bot.handlers import start, admin
-from bot.middlewares import AdminMiddleware
+from bot.middlewares import (
+    AdminMiddleware,
+    RateLimitRequestMiddleware,
+    SessionMiddleware,
+)
+from bot.storage import LRUMemoryStorage
+from worker.telethon_client import close_telethon_client
 
 logging.basicConfig(
     level=logging.INFO,
@@ -19,22 +27,19 @@ logging.basicConfig(
 logger = logging.getLogger(__name__)
 
 
-async def setup_database(settings) -> async_sessionmaker:
-    """Initialize database and return session factory."""
-    engine = create_async_engine(
-        settings.DATABASE_URL,
-        echo=False,
-        pool_pre_ping=True,
-    )
-    
-    async with engine.begin() as conn:
-        await conn.run_sync(Base.metadata.create_all)
-    
-    return async_sessionmaker(
-        engine,
-        class_=AsyncSession,
-        expire_on_commit=False,
-    )
+def orjson_dumps(obj: Any) -> str:
+    """Serialize a Bot API payload with orjson; aiogram expects str."""
+    return orjson.dumps(obj).decode()
+
+
+async def setup_database() -> async_sessionmaker:
+    """Initialize database and return session factory.
+
+    Uses the shared engine from core.database, so handlers and background
+    parsing runs draw from one connection pool.
+    """
+    await init_db()
+    return get_async_session()
 
 
 async def main():
@@ -42,34 +47,25 @@ async def main():
     settings = get_settings()
     
     logger.info("Setting up database...")
-    session_factory = await setup_database(settings)
+    session_factory = await setup_database()
     
     logger.info("Initializing bot...")
-    bot = Bot(token=settings.BOT_TOKEN)
-    storage = MemoryStorage()
+    # One HTTP session (and connection pool) for polling, handlers and
+    # background parsing notifications. orjson handles both directions,
+    # including decoding every getUpdates response
+    session = AiohttpSession(json_loads=orjson.loads, json_dumps=orjson_dumps)
+    bot = Bot(token=settings.BOT_TOKEN, session=session)
+    bot.session.middleware(RateLimitRequestMiddleware())
+    storage = LRUMemoryStorage(maxsize=10_000)
     dp = Dispatcher(storage=storage)
     
     # Admin middleware
     dp.message.middleware(AdminMiddleware())
     dp.callback_query.middleware(AdminMiddleware())
     
-    # Session middleware
-    from aiogram import BaseMiddleware
-    from typing import Callable, Dict, Any, Awaitable
-    from aiogram.types import TelegramObject
-    
-    class SessionMiddleware(BaseMiddleware):
-        async def __call__(
-            self,
-            handler: Callable[[TelegramObject, Dict[str, Any]], Awaitable[Any]],
-            event: TelegramObject,
-            data: Dict[str, Any],
-        ) -> Any:
-            async with session_factory() as session:
-                data["session"] = session
-                return await handler(event, data)
-    
-    dp.update.middleware(SessionMiddleware())
+    # After AdminMiddleware, so blocked updates never open a session
+    dp.message.middleware(SessionMiddleware(session_factory))
+    dp.callback_query.middleware(SessionMiddleware(session_factory))
     
     # Register routers
     dp.include_router(start.router)
@@ -80,6 +76,8 @@ async def main():
         await dp.start_polling(bot)
     finally:
         await bot.session.close()
+        await close_telethon_client()
+        await close_db()
 
 
 if __name__ == "__main__":
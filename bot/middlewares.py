@@ -1,15 +1,32 @@
 """Middlewares for the Telegram bot."""
 
+import logging
 from typing import Any, Awaitable, Callable, Dict
 
-from aiogram import BaseMiddleware
-from aiogram.types import Message
+from aiogram import BaseMiddleware, Bot
+from aiogram.client.session.middlewares.base import (
+    BaseRequestMiddleware,
+    NextRequestMiddlewareType,
+)
+from aiogram.methods import GetUpdates, Response, TelegramMethod
+from aiogram.methods.base import TelegramType
+from aiogram.types import Message, TelegramObject
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
 
 from core.config import get_settings
+from core.ratelimit import AsyncRateLimiter
+
+logger = logging.getLogger(__name__)
 
 
 class AdminMiddleware(BaseMiddleware):
-    """Middleware that restricts bot access to admin users only."""
+    """Middleware that restricts bot access to admin users only.
+
+    Admin IDs are read from settings once, when the middleware is created.
+    """
+
+    def __init__(self):
+        self._admin_ids = get_settings().ADMIN_IDS
 
     async def __call__(
         self,
@@ -17,19 +34,58 @@ class AdminMiddleware(BaseMiddleware):
         event: Message,
         data: Dict[str, Any],
     ) -> Any:
-        import logging
-        logger = logging.getLogger(__name__)
-        
-        settings = get_settings()
-        
         # Get user from message or callback
         user = getattr(event, 'from_user', None)
         
-        logger.info(f"User: {user.id if user else None}, ADMIN_IDS: {settings.ADMIN_IDS}")
-        
-        if user and user.id in settings.ADMIN_IDS:
-            logger.info(f"User {user.id} is admin, allowing")
+        if user and user.id in self._admin_ids:
             return await handler(event, data)
         
-        logger.info(f"User {user.id if user else None} is NOT admin, blocking")
+        logger.debug("Blocked update from non-admin user %s", user.id if user else None)
         return None
+
+
+class SessionMiddleware(BaseMiddleware):
+    """Middleware that provides a database session to handlers.
+
+    Must be registered as an inner middleware so the matched handler is
+    known: a session is only opened for handlers that take a `session`
+    argument.
+    """
+
+    def __init__(self, session_factory: async_sessionmaker[AsyncSession]):
+        self._session_factory = session_factory
+
+    async def __call__(
+        self,
+        handler: Callable[[TelegramObject, Dict[str, Any]], Awaitable[Any]],
+        event: TelegramObject,
+        data: Dict[str, Any],
+    ) -> Any:
+        if "session" not in data["handler"].params:
+            return await handler(event, data)
+        
+        async with self._session_factory() as session:
+            data["session"] = session
+            return await handler(event, data)
+
+
+class RateLimitRequestMiddleware(BaseRequestMiddleware):
+    """Bot session middleware that caps outgoing Bot API calls.
+
+    Telegram allows about 30 messages per second per bot; bursts of button
+    presses are spread out here instead of failing with 429 retries.
+    """
+
+    def __init__(self, rate: float = 30, period: float = 1.0):
+        self._limiter = AsyncRateLimiter(rate, period)
+
+    async def __call__(
+        self,
+        make_request: NextRequestMiddlewareType[TelegramType],
+        bot: Bot,
+        method: TelegramMethod[TelegramType],
+    ) -> Response[TelegramType]:
+        # Long polling is not a message and must not wait for tokens
+        if not isinstance(method, GetUpdates):
+            await self._limiter.acquire()
+        return await make_request(bot, method)
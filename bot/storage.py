@@ -0,0 +1,78 @@
+"""Bounded in-memory FSM storage for the Telegram bot."""
+
+from collections import OrderedDict
+from collections.abc import Mapping
+from copy import copy
+from typing import Any
+
+from aiogram.exceptions import DataNotDictLikeError
+from aiogram.fsm.state import State
+from aiogram.fsm.storage.base import BaseStorage, StateType, StorageKey
+from aiogram.fsm.storage.memory import MemoryStorageRecord
+
+
+class LRUMemoryStorage(BaseStorage):
+    """In-memory FSM storage that keeps at most `maxsize` records.
+
+    Unlike aiogram's MemoryStorage, reading the state of an unknown key
+    does not create a record, and the least recently used records are
+    evicted once the limit is reached, so memory stays bounded no matter
+    how many distinct users write to the bot.
+    """
+
+    def __init__(self, maxsize: int = 10_000):
+        """Initialize the storage.
+
+        Args:
+            maxsize: Maximum number of records kept in memory.
+        """
+        if maxsize <= 0:
+            raise ValueError("maxsize must be positive")
+
+        self.maxsize = maxsize
+        self.storage: OrderedDict[StorageKey, MemoryStorageRecord] = OrderedDict()
+
+    def _get(self, key: StorageKey) -> MemoryStorageRecord | None:
+        record = self.storage.get(key)
+        if record is not None:
+            self.storage.move_to_end(key)
+        return record
+
+    def _get_or_create(self, key: StorageKey) -> MemoryStorageRecord:
+        record = self._get(key)
+        if record is None:
+            record = self.storage[key] = MemoryStorageRecord()
+            if len(self.storage) > self.maxsize:
+                self.storage.popitem(last=False)
+        return record
+
+    async def close(self) -> None:
+        pass
+
+    async def set_state(self, key: StorageKey, state: StateType = None) -> None:
+        self._get_or_create(key).state = state.state if isinstance(state, State) else state
+
+    async def get_state(self, key: StorageKey) -> str | None:
+        record = self._get(key)
+        return record.state if record is not None else None
+
+    async def set_data(self, key: StorageKey, data: Mapping[str, Any]) -> None:
+        if not isinstance(data, dict):
+            msg = f"Data must be a dict or dict-like object, got {type(data).__name__}"
+            raise DataNotDictLikeError(msg)
+        self._get_or_create(key).data = data.copy()
+
+    async def get_data(self, key: StorageKey) -> dict[str, Any]:
+        record = self._get(key)
+        return record.data.copy() if record is not None else {}
+
+    async def get_value(
+        self,
+        storage_key: StorageKey,
+        dict_key: str,
+        default: Any | None = None,
+    ) -> Any | None:
+        record = self._get(storage_key)
+        if record is None:
+            return default
+        return copy(record.data.get(dict_key, default))
@@ -4,12 +4,18 @@ Loads settings from environment variables and YAML config files.
 """
 
 from pathlib import Path
-from typing import Any
+from typing import IO, Any, Callable
 
 import yaml
 from pydantic import field_validator
 from pydantic_settings import BaseSettings, SettingsConfigDict
 
+# libyaml-based loader is much faster; PyYAML may be built without it
+try:
+    from yaml import CSafeLoader as YamlLoader
+except ImportError:  # pragma: no cover
+    from yaml import SafeLoader as YamlLoader
+
 
 class Settings(BaseSettings):
     """Application settings loaded from environment variables."""
@@ -22,7 +28,7 @@ class Settings(BaseSettings):
 
     # Telegram Bot (optional for worker)
     BOT_TOKEN: str = ""
-    ADMIN_IDS: list[int] = []
+    ADMIN_IDS: frozenset[int] = frozenset()
 
     # Telegram Userbot (Telethon)
     TELEGRAM_API_ID: int
@@ -31,6 +37,9 @@ class Settings(BaseSettings):
 
     # Database
     DATABASE_URL: str
+    DB_POOL_SIZE: int = 20
+    DB_MAX_OVERFLOW: int = 10
+    DB_POOL_RECYCLE_SEC: int = 1800
 
     @field_validator("DATABASE_URL", mode="before")
     @classmethod
@@ -46,67 +55,130 @@ class Settings(BaseSettings):
 
     # Worker settings
     PARSE_DAYS: int = 2  # Today + yesterday
-    REQUEST_DELAY_SEC: float = 1.5
+    TELEGRAM_REQUESTS_PER_SEC: float = 5.0  # Shared by all Telethon calls
+    PARSE_CONCURRENCY: int = 3  # Chats fetched at the same time
     MIN_MESSAGE_LENGTH: int = 10
 
+    # Exports
+    EXPORT_DIR: str = "exports"
+    EXPORT_TTL_DAYS: int = 7  # Older export files are deleted after a run
+
     @field_validator("ADMIN_IDS", mode="before")
     @classmethod
-    def parse_admin_ids(cls, v: Any) -> list[int]:
-        """Parse ADMIN_IDS from comma-separated string or list."""
+    def parse_admin_ids(cls, v: Any) -> frozenset[int]:
+        """Parse ADMIN_IDS from comma-separated string or list into a set."""
         import logging
         import os
         logger = logging.getLogger(__name__)
         
         # Also try to get directly from env if v is empty
-        if v is None or v == "" or v == []:
+        if v is None or v == "" or v == [] or v == frozenset():
             v = os.environ.get("ADMIN_IDS", "")
         
         logger.info(f"Parsing ADMIN_IDS: '{v}' (type: {type(v)})")
         
         if v is None or v == "":
-            return []
+            return frozenset()
         if isinstance(v, str):
             v = v.strip().strip('"').strip("'")  # Remove quotes
             if not v:
-                return []
-            result = [int(x.strip()) for x in v.split(",") if x.strip()]
+                return frozenset()
+            result = frozenset(int(x.strip()) for x in v.split(",") if x.strip())
             logger.info(f"Parsed ADMIN_IDS: {result}")
             return result
-        if isinstance(v, list):
-            return [int(x) for x in v]
+        if isinstance(v, (list, set, frozenset)):
+            return frozenset(int(x) for x in v)
         if isinstance(v, int):
-            return [v]
-        return []
+            return frozenset((v,))
+        return frozenset()
+
+
+# Parsed chat configs keyed by absolute file path:
+# ((mtime_ns, size), config)
+_chats_config_cache: dict[Path, tuple[tuple[int, int], dict[str, Any]]] = {}
+
+
+def _parse_crypto_txt(path: Path) -> dict[str, Any]:
+    """Parse a list of t.me links into a chat configuration."""
+    with open(path, encoding="utf-8") as f:
+        lines = f.readlines()
+    
+    chats = []
+    for line in lines:
+        line = line.strip()
+        if line.startswith("https://t.me/"):
+            chat_id = line.replace("https://t.me/", "").strip()
+            if chat_id and chat_id not in chats:
+                chats.append(chat_id)
+    
+    return {
+        "chats": chats,
+        "settings": {
+            "parse_days": 2,
+            "min_message_length": 10,
+        }
+    }
+
+
+def load_chats_config_from_stream(stream: str | IO[str]) -> dict[str, Any]:
+    """Parse and validate a YAML chat configuration.
+
+    Args:
+        stream: YAML text or a text file-like object.
+
+    Returns:
+        Dictionary with "chats" list and optional "settings".
+    """
+    config = yaml.load(stream, Loader=YamlLoader)
+
+    if config is None:
+        raise ValueError("Configuration file is empty")
+
+    if "chats" not in config:
+        raise ValueError("Configuration must contain 'chats' key")
+
+    return config
+
+
+def _parse_chats_yaml(path: Path) -> dict[str, Any]:
+    """Parse and validate a YAML chat configuration file."""
+    with open(path, encoding="utf-8") as f:
+        return load_chats_config_from_stream(f)
+
+
+def _load_cached(path: Path, parse: Callable[[Path], dict[str, Any]]) -> dict[str, Any]:
+    """Parse a config file, reusing the previous result while it is unchanged."""
+    path = path.resolve()
+    stat = path.stat()
+    # Size catches rewrites within the filesystem's mtime granularity
+    version = (stat.st_mtime_ns, stat.st_size)
+    cached = _chats_config_cache.get(path)
+    if cached is not None and cached[0] == version:
+        return cached[1]
+    
+    config = parse(path)
+    _chats_config_cache[path] = (version, config)
+    return config
+
+
+def clear_chats_config_cache() -> None:
+    """Forget parsed chat configs so the next load re-reads the files."""
+    _chats_config_cache.clear()
 
 
 def load_chats_config(config_path: str | Path = "config/chats.yaml") -> dict[str, Any]:
     """Load chat configuration from YAML file or crypto.txt.
 
+    Parsed files are cached until their modification time changes, so the
+    returned dictionary is shared between calls and must not be modified.
+
     Returns:
         Dictionary with "chats" list and "settings".
     """
     # Try to load from crypto.txt first
     crypto_txt = Path("crypto.txt")
     if crypto_txt.exists():
-        with open(crypto_txt, encoding="utf-8") as f:
-            lines = f.readlines()
-        
-        chats = []
-        for line in lines:
-            line = line.strip()
-            if line.startswith("https://t.me/"):
-                chat_id = line.replace("https://t.me/", "").strip()
-                if chat_id and chat_id not in chats:
-                    chats.append(chat_id)
-        
-        return {
-            "chats": chats,
-            "settings": {
-                "parse_days": 2,
-                "request_delay_sec": 1.5,
-                "min_message_length": 10,
-            }
-        }
+        return _load_cached(crypto_txt, _parse_crypto_txt)
     
     # Fallback to YAML
     path = Path(config_path)
@@ -114,16 +186,7 @@ def load_chats_config(config_path: str | Path = "config/chats.yaml") -> dict[str
     if not path.exists():
         raise FileNotFoundError(f"Configuration file not found: {config_path}")
 
-    with open(path, encoding="utf-8") as f:
-        config = yaml.safe_load(f)
-
-    if config is None:
-        raise ValueError("Configuration file is empty")
-
-    if "chats" not in config:
-        raise ValueError("Configuration must contain 'chats' key")
-
-    return config
+    return _load_cached(path, _parse_chats_yaml)
 
 
 # Global settings instance (lazy loaded)
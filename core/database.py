@@ -3,6 +3,7 @@
 Provides async engine, session factory, and database initialization.
 """
 
+from sqlalchemy import Connection, inspect
 from sqlalchemy.ext.asyncio import (
     AsyncEngine,
     AsyncSession,
@@ -13,11 +14,26 @@ from sqlalchemy.ext.asyncio import (
 from core.config import get_settings
 from core.models import Base
 
+# Per-connection cache sizes for asyncpg: SQLAlchemy's prepared statement
+# cache and asyncpg's own statement cache, so repeated queries skip the
+# server-side parse/plan step
+STATEMENT_CACHE_SIZE = 512
+
 # Global engine and session factory (lazy initialized)
 _async_engine: AsyncEngine | None = None
 _async_session: async_sessionmaker[AsyncSession] | None = None
 
 
+def get_connect_args(database_url: str) -> dict:
+    """Get driver-specific connect arguments for the database URL."""
+    if database_url.startswith("postgresql+asyncpg://"):
+        return {
+            "prepared_statement_cache_size": STATEMENT_CACHE_SIZE,
+            "statement_cache_size": STATEMENT_CACHE_SIZE,
+        }
+    return {}
+
+
 def get_async_engine() -> AsyncEngine:
     """Get or create the async database engine.
 
@@ -31,8 +47,12 @@ def get_async_engine() -> AsyncEngine:
             settings.DATABASE_URL,
             echo=False,
             pool_pre_ping=True,
-            pool_size=5,
-            max_overflow=10,
+            pool_size=settings.DB_POOL_SIZE,
+            max_overflow=settings.DB_MAX_OVERFLOW,
+            pool_recycle=settings.DB_POOL_RECYCLE_SEC,
+            # Reuse the most recent connection so its statement cache stays warm
+            pool_use_lifo=True,
+            connect_args=get_connect_args(settings.DATABASE_URL),
         )
     return _async_engine
 
@@ -54,9 +74,18 @@ def get_async_session() -> async_sessionmaker[AsyncSession]:
     return _async_session
 
 
+def _has_all_tables(conn: Connection) -> bool:
+    """Check in a single query whether every model table already exists."""
+    existing = set(inspect(conn).get_table_names())
+    return all(table.name in existing for table in Base.metadata.sorted_tables)
+
+
 async def init_db(drop_existing: bool = False) -> None:
     """Initialize the database by creating all tables.
 
+    On a database that already has every table this is a single catalog
+    query; create_all() only runs when something is missing.
+
     Args:
         drop_existing: If True, drops all tables first (use for schema changes).
     """
@@ -64,6 +93,8 @@ async def init_db(drop_existing: bool = False) -> None:
     async with engine.begin() as conn:
         if drop_existing:
             await conn.run_sync(Base.metadata.drop_all)
+        elif await conn.run_sync(_has_all_tables):
+            return
         await conn.run_sync(Base.metadata.create_all)
 
 
@@ -0,0 +1,137 @@
+"""Export storage for parsed messages.
+
+Exports are written to JSON files on disk; ParseLog only keeps the path,
+size and checksum, so large payloads never pass through the database.
+"""
+
+import hashlib
+import logging
+import time
+from dataclasses import dataclass
+from datetime import datetime
+from pathlib import Path
+from typing import Any
+
+import orjson
+
+from core.config import get_settings
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass(frozen=True, slots=True)
+class ExportFile:
+    """Metadata of a written export file."""
+
+    path: Path
+    size: int
+    sha256: str
+
+
+def get_export_dir() -> Path:
+    """Get the directory for export files, creating it if needed."""
+    export_dir = Path(get_settings().EXPORT_DIR)
+    export_dir.mkdir(parents=True, exist_ok=True)
+    return export_dir
+
+
+def remove_old_exports(keep: Path) -> int:
+    """Delete export files older than EXPORT_TTL_DAYS.
+
+    Blocking: async callers should run it via asyncio.to_thread.
+
+    Args:
+        keep: Export that is kept regardless of age (the one just written).
+
+    Returns:
+        Number of files removed.
+    """
+    cutoff = time.time() - get_settings().EXPORT_TTL_DAYS * 86400
+    removed = 0
+
+    for path in get_export_dir().glob("crypto_*.json"):
+        if path == keep:
+            continue
+        try:
+            if path.stat().st_mtime < cutoff:
+                path.unlink()
+                removed += 1
+        except OSError as e:
+            logger.warning(f"Could not remove old export {path}: {e}")
+
+    return removed
+
+
+class ExportWriter:
+    """Incremental writer for a JSON export file.
+
+    Messages are appended chat by chat, so peak memory is bounded by the
+    largest chat instead of the whole run. The SHA-256 checksum and size
+    are computed while writing. Writes are blocking: async callers should
+    run write_messages() and finish() via asyncio.to_thread.
+
+    Usage:
+        with ExportWriter(log_id, started_at, {"parsed_at": ...}) as writer:
+            writer.write_messages(messages)
+            export = writer.finish({"messages_count": writer.messages_count})
+
+    If the block exits with an exception, the partial file is removed.
+    """
+
+    def __init__(self, log_id: int, started_at: datetime, header: dict[str, Any]):
+        """Open the export file and write the header fields.
+
+        Args:
+            log_id: ID of the ParseLog the export belongs to.
+            started_at: Start time of the parsing run, used in the file name.
+            header: Non-empty fields written before the messages list.
+        """
+        if not header:
+            raise ValueError("Export header must not be empty")
+
+        self.path = get_export_dir() / f"crypto_{started_at:%Y%m%d_%H%M%S}_{log_id}.json"
+        self.messages_count = 0
+        self._size = 0
+        self._sha256 = hashlib.sha256()
+        self._file = open(self.path, "wb")
+
+        # '{"a":1}' -> '{"a":1,"messages":['
+        self._write(orjson.dumps(header)[:-1] + b',"messages":[')
+
+    def _write(self, chunk: bytes) -> None:
+        self._file.write(chunk)
+        self._sha256.update(chunk)
+        self._size += len(chunk)
+
+    def write_messages(self, messages: list[dict[str, Any]]) -> None:
+        """Append messages to the export."""
+        for message in messages:
+            if self.messages_count:
+                self._write(b",")
+            self._write(orjson.dumps(message))
+            self.messages_count += 1
+
+    def finish(self, trailer: dict[str, Any]) -> ExportFile:
+        """Write trailing fields, close the file and return its metadata."""
+        self._write(b"]")
+        if trailer:
+            # '{"b":2}' -> ',"b":2}'
+            self._write(b"," + orjson.dumps(trailer)[1:])
+        else:
+            self._write(b"}")
+        self._file.close()
+
+        return ExportFile(
+            path=self.path,
+            size=self._size,
+            sha256=self._sha256.hexdigest(),
+        )
+
+    def __enter__(self) -> "ExportWriter":
+        return self
+
+    def __exit__(self, exc_type, exc, tb) -> None:
+        if not self._file.closed:
+            self._file.close()
+        if exc_type is not None:
+            self.path.unlink(missing_ok=True)
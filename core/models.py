@@ -4,12 +4,17 @@ Simplified models: just ParseLog for tracking parse jobs.
 Messages are stored in JSON files, not in DB.
 """
 
-from datetime import datetime
+from datetime import datetime, timezone
 
-from sqlalchemy import DateTime, Integer, String, Text, func
+from sqlalchemy import DateTime, Index, Integer, String, Text, func
 from sqlalchemy.orm import DeclarativeBase, Mapped, mapped_column
 
 
+def utcnow() -> datetime:
+    """Current UTC time as a naive datetime, as stored in DateTime columns."""
+    return datetime.now(timezone.utc).replace(tzinfo=None)
+
+
 class Base(DeclarativeBase):
     """Base class for all SQLAlchemy models."""
     pass
@@ -19,6 +24,12 @@ class ParseLog(Base):
     """Model for storing parsing job logs."""
 
     __tablename__ = "parse_logs"
+    __table_args__ = (
+        # Latest log lookups: ORDER BY started_at DESC, optionally
+        # filtered by status='success'
+        Index("ix_parselog_started", "started_at"),
+        Index("ix_parselog_status_started", "status", "started_at"),
+    )
 
     id: Mapped[int] = mapped_column(Integer, primary_key=True, autoincrement=True)
     started_at: Mapped[datetime] = mapped_column(
@@ -28,7 +39,9 @@ class ParseLog(Base):
     status: Mapped[str] = mapped_column(String(20), default="running")
     chats_parsed: Mapped[int] = mapped_column(Integer, default=0)
     messages_found: Mapped[int] = mapped_column(Integer, default=0)
-    json_data: Mapped[str | None] = mapped_column(Text, nullable=True)  # JSON stored in DB
+    json_path: Mapped[str | None] = mapped_column(String(255), nullable=True)  # Export file on disk
+    json_size: Mapped[int | None] = mapped_column(Integer, nullable=True)  # Bytes
+    json_sha256: Mapped[str | None] = mapped_column(String(64), nullable=True)
     error_message: Mapped[str | None] = mapped_column(Text, nullable=True)
 
     def __repr__(self) -> str:
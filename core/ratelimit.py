@@ -0,0 +1,52 @@
+"""Async token-bucket rate limiter.
+
+Used to keep outgoing Telegram API traffic under the server-side limits
+without sleeping a fixed delay between calls.
+"""
+
+import asyncio
+import time
+
+
+class AsyncRateLimiter:
+    """Token bucket allowing `rate` acquisitions per `period` seconds.
+
+    Usage:
+        limiter = AsyncRateLimiter(30, 1.0)
+        async with limiter:
+            await do_request()
+    """
+
+    def __init__(self, rate: float, period: float = 1.0):
+        if rate <= 0 or period <= 0:
+            raise ValueError("rate and period must be positive")
+        self.rate = rate
+        self.period = period
+        # A bucket must hold at least one whole token, or fractional rates
+        # (e.g. 0.5 per second) could never be acquired
+        self.capacity = max(float(rate), 1.0)
+        self._tokens = self.capacity
+        self._updated = time.monotonic()
+        self._lock = asyncio.Lock()
+
+    async def acquire(self) -> None:
+        """Wait until a token is available and take it."""
+        async with self._lock:
+            while True:
+                now = time.monotonic()
+                refill = (now - self._updated) * self.rate / self.period
+                self._tokens = min(self.capacity, self._tokens + refill)
+                self._updated = now
+
+                if self._tokens >= 1:
+                    self._tokens -= 1
+                    return
+
+                await asyncio.sleep((1 - self._tokens) * self.period / self.rate)
+
+    async def __aenter__(self) -> "AsyncRateLimiter":
+        await self.acquire()
+        return self
+
+    async def __aexit__(self, *exc_info) -> None:
+        return None
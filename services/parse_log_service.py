@@ -0,0 +1,120 @@
+"""Parse log service with an in-process cache of the latest runs.
+
+Status and export buttons only need a small summary of the most recent
+parse log, so the summary is kept in memory and refreshed whenever the
+bot commits a run.
+"""
+
+import time
+from dataclasses import dataclass
+from datetime import datetime
+from typing import Any
+
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from core.models import ParseLog
+
+# How long a snapshot read from the database is trusted. Runs started by
+# the worker process never reach remember_parse_log(), so it must expire.
+LATEST_LOG_TTL_SEC = 30.0
+
+
+@dataclass(frozen=True, slots=True)
+class ParseLogSnapshot:
+    """Immutable summary of a ParseLog row, safe to share between updates."""
+
+    id: int
+    started_at: datetime
+    finished_at: datetime | None
+    status: str
+    chats_parsed: int
+    messages_found: int
+    json_path: str | None
+    json_size: int | None
+
+    @classmethod
+    def from_row(cls, row: Any) -> "ParseLogSnapshot":
+        """Build a snapshot from a ParseLog object or a selected row."""
+        return cls(
+            id=row.id,
+            started_at=row.started_at,
+            finished_at=row.finished_at,
+            status=row.status,
+            chats_parsed=row.chats_parsed or 0,
+            messages_found=row.messages_found or 0,
+            json_path=row.json_path,
+            json_size=row.json_size,
+        )
+
+
+# Statements are built once so SQLAlchemy's compiled cache and the
+# driver's prepared statement cache are hit on every call
+_LATEST_STMT = (
+    select(
+        ParseLog.id,
+        ParseLog.started_at,
+        ParseLog.finished_at,
+        ParseLog.status,
+        ParseLog.chats_parsed,
+        ParseLog.messages_found,
+        ParseLog.json_path,
+        ParseLog.json_size,
+    )
+    .order_by(ParseLog.started_at.desc())
+    .limit(1)
+)
+_LATEST_SUCCESS_STMT = _LATEST_STMT.where(ParseLog.status == "success").where(
+    ParseLog.json_path.isnot(None)
+)
+
+# success_only flag -> (expires_at, snapshot or None if there is no such log)
+_latest_cache: dict[bool, tuple[float, ParseLogSnapshot | None]] = {}
+
+
+def remember_parse_log(log: ParseLog) -> ParseLogSnapshot:
+    """Record a freshly committed log as the latest one.
+
+    Returns:
+        Snapshot stored in the cache.
+    """
+    snapshot = ParseLogSnapshot.from_row(log)
+    expires_at = time.monotonic() + LATEST_LOG_TTL_SEC
+    _latest_cache[False] = (expires_at, snapshot)
+    if snapshot.status == "success" and snapshot.json_path:
+        _latest_cache[True] = (expires_at, snapshot)
+    return snapshot
+
+
+def clear_parse_log_cache() -> None:
+    """Forget cached snapshots so the next read goes to the database."""
+    _latest_cache.clear()
+
+
+class ParseLogService:
+    """Service for reading parse logs."""
+
+    def __init__(self, session: AsyncSession):
+        self.session = session
+
+    async def get_latest(self, success_only: bool = False) -> ParseLogSnapshot | None:
+        """Get a summary of the latest parse log.
+
+        Args:
+            success_only: Only consider successful runs that have an export.
+
+        Returns:
+            Snapshot of the latest log, or None if there is none.
+        """
+        cached = _latest_cache.get(success_only)
+        if cached is not None and cached[0] > time.monotonic():
+            return cached[1]
+
+        stmt = _LATEST_SUCCESS_STMT if success_only else _LATEST_STMT
+
+        result = await self.session.execute(stmt)
+        row = result.one_or_none()
+        snapshot = ParseLogSnapshot.from_row(row) if row else None
+
+        _latest_cache[success_only] = (time.monotonic() + LATEST_LOG_TTL_SEC, snapshot)
+        return snapshot
@@ -0,0 +1,29 @@
+"""Shared pytest configuration.
+
+Registers hypothesis profiles; pick one with HYPOTHESIS_PROFILE
+(default "ci"):
+
+- ci: the full 100 random examples per property
+- dev: few derandomized examples for quick local iteration
+  (HYPOTHESIS_PROFILE=dev pytest)
+
+dev keeps no example database (derandomized runs do not use one). Under
+pytest-xdist (`pytest -n auto`) every ci worker gets its own example
+database, so workers do not contend for the same directory.
+"""
+
+import os
+
+from hypothesis import settings
+from hypothesis.database import DirectoryBasedExampleDatabase
+
+_xdist_worker = os.getenv("PYTEST_XDIST_WORKER")
+_database = (
+    {"database": DirectoryBasedExampleDatabase(f".hypothesis/examples-{_xdist_worker}")}
+    if _xdist_worker
+    else {}
+)
+
+settings.register_profile("dev", max_examples=25, deadline=None, derandomize=True)
+settings.register_profile("ci", max_examples=100, deadline=None, **_database)
+settings.load_profile(os.getenv("HYPOTHESIS_PROFILE", "ci"))
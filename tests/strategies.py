@@ -0,0 +1,18 @@
+"""Shared hypothesis strategies for the test suite."""
+
+from hypothesis import assume, strategies as st
+
+# Python identifiers, generated directly instead of filtering random text
+identifier_strategy = st.from_regex(r"[A-Za-z_][A-Za-z0-9_]{0,19}", fullmatch=True)
+
+
+@st.composite
+def nonblank_text(draw, min_size: int = 1, **kwargs) -> str:
+    """Text without surrounding whitespace and at least `min_size` long.
+
+    Strips the drawn text instead of filtering out blank strings, so
+    hypothesis rarely has to throw examples away.
+    """
+    text = draw(st.text(min_size=min_size, **kwargs)).strip()
+    assume(len(text) >= min_size)
+    return text
@@ -6,7 +6,7 @@ Tests that admin middleware correctly filters non-admin users.
 from unittest.mock import AsyncMock, MagicMock, patch
 
 import pytest
-from hypothesis import given, settings, strategies as st
+from hypothesis import given, strategies as st
 
 from bot.middlewares import WhitelistMiddleware
 
@@ -32,7 +32,6 @@ admin_command_strategy = st.sampled_from(["/status", "/parse", "/stats"])
     admin_ids=admin_ids_strategy,
     command=admin_command_strategy,
 )
-@settings(max_examples=100, deadline=None)
 def test_admin_middleware_filtering(
     user_id: int,
     admin_ids: list[int],
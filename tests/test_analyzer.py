@@ -8,7 +8,7 @@ import math
 from datetime import datetime
 
 import pytest
-from hypothesis import given, settings, assume, strategies as st
+from hypothesis import given, assume, strategies as st
 
 from worker.jobs.analyzer import (
     split_into_batches,
@@ -62,7 +62,6 @@ def request_strategy():
     messages=st.lists(message_strategy(), min_size=0, max_size=200),
     batch_size=st.integers(min_value=1, max_value=100),
 )
-@settings(max_examples=100, deadline=None)
 def test_batch_splitting_correctness(messages: list[dict], batch_size: int):
     """
     Property 5: Batch splitting correctness
@@ -108,7 +107,6 @@ def test_batch_splitting_correctness(messages: list[dict], batch_size: int):
 
 # **Feature: freelance-parser-bot, Property 6: Gemini JSON response parsing**
 @given(requests=st.lists(request_strategy(), min_size=0, max_size=20))
-@settings(max_examples=100, deadline=None)
 def test_gemini_json_response_parsing(requests: list[dict]):
     """
     Property 6: Gemini JSON response parsing
@@ -156,7 +154,6 @@ def test_gemini_json_response_parsing(requests: list[dict]):
 
 # Test parsing with markdown code blocks
 @given(requests=st.lists(request_strategy(), min_size=1, max_size=10))
-@settings(max_examples=100, deadline=None)
 def test_json_parsing_with_markdown_blocks(requests: list[dict]):
     """
     Verify parser handles JSON wrapped in markdown code blocks.
@@ -183,7 +180,6 @@ def test_json_parsing_with_markdown_blocks(requests: list[dict]):
 @given(
     messages=st.lists(message_strategy(), min_size=1, max_size=20),
 )
-@settings(max_examples=100, deadline=None)
 def test_metadata_preservation(messages: list[dict]):
     """
     Property 7: Metadata preservation
@@ -241,7 +237,6 @@ def test_metadata_preservation(messages: list[dict]):
 @given(
     messages=st.lists(message_strategy(), min_size=1, max_size=10),
 )
-@settings(max_examples=100, deadline=None)
 def test_metadata_preservation_unmatched_requests(messages: list[dict]):
     """
     Verify that requests without matching messages are still included in output
@@ -3,90 +3,77 @@
 Tests YAML config parsing correctness using hypothesis.
 """
 
-import tempfile
-from pathlib import Path
-
 import pytest
 import yaml
-from hypothesis import given, settings, strategies as st
+from hypothesis import given, strategies as st
 
-from core.config import load_chats_config
+from core.config import (
+    clear_chats_config_cache,
+    load_chats_config,
+    load_chats_config_from_stream,
+)
+from tests.strategies import identifier_strategy, nonblank_text
 
+# libyaml-based dumper when available, like the loader in core.config
+YamlDumper = getattr(yaml, "CSafeDumper", yaml.SafeDumper)
 
-# Strategy for generating valid category names (non-empty strings)
-category_name_strategy = st.text(
-    alphabet=st.characters(whitelist_categories=("L", "N", "P", "S")),
-    min_size=1,
-    max_size=50,
-).filter(lambda x: x.strip())
 
 # Strategy for generating valid chat identifiers
 chat_id_strategy = st.one_of(
     st.integers(min_value=-1000000000000, max_value=-1),  # Telegram group IDs
-    st.text(min_size=1, max_size=32).filter(lambda x: x.strip()),  # Usernames
+    nonblank_text(max_size=32),  # Usernames
 )
 
-# Strategy for generating a single category
-category_strategy = st.fixed_dictionaries({
-    "name": category_name_strategy,
-    "chats": st.lists(chat_id_strategy, min_size=1, max_size=10),
-})
-
-# Strategy for generating valid categories dict
-categories_dict_strategy = st.dictionaries(
-    keys=st.text(
-        alphabet=st.characters(whitelist_categories=("L", "N")),
-        min_size=1,
-        max_size=20,
-    ).filter(lambda x: x.strip() and x.isidentifier()),
-    values=category_strategy,
-    min_size=1,
+# Strategy for generating the optional settings section
+settings_strategy = st.dictionaries(
+    keys=identifier_strategy,
+    values=st.integers(min_value=0, max_value=1000),
     max_size=5,
 )
 
 
+@pytest.fixture(autouse=True)
+def clean_cache(tmp_path, monkeypatch):
+    """Run each test in an empty directory, so ./crypto.txt is not picked up."""
+    monkeypatch.chdir(tmp_path)
+    clear_chats_config_cache()
+    yield
+    clear_chats_config_cache()
+
+
 # **Feature: freelance-parser-bot, Property 14: YAML config parsing**
-@given(categories=categories_dict_strategy)
-@settings(max_examples=100, deadline=None)
-def test_yaml_config_parsing_produces_categories_with_required_fields(categories: dict):
+@given(
+    chats=st.lists(chat_id_strategy, min_size=1, max_size=10),
+    settings=settings_strategy,
+)
+def test_yaml_config_parsing_preserves_chats_and_settings(chats: list, settings: dict):
     """
     Property 14: YAML config parsing
 
     *For any* valid chats.yaml content, parsing SHALL produce a dict with
-    "categories" key containing category objects with "name", "chats" fields.
+    the "chats" list and the "settings" section unchanged.
 
     **Validates: Requirements 6.2**
     """
-    # Create a valid YAML config
-    config_content = {"categories": categories}
+    config_content = {"settings": settings, "chats": chats}
+    text = yaml.dump(config_content, Dumper=YamlDumper, allow_unicode=True)
 
-    # Write to temporary file
-    with tempfile.NamedTemporaryFile(
-        mode="w", suffix=".yaml", delete=False, encoding="utf-8"
-    ) as f:
-        yaml.safe_dump(config_content, f, allow_unicode=True)
-        temp_path = f.name
+    result = load_chats_config_from_stream(text)
 
-    try:
-        # Parse the config
-        result = load_chats_config(temp_path)
+    assert result == config_content
 
-        # Verify the result has "categories" key
-        assert "categories" in result, "Result must contain 'categories' key"
 
-        # Verify each category has required fields
-        for slug, category in result["categories"].items():
-            assert "name" in category, f"Category '{slug}' must have 'name' field"
-            assert "chats" in category, f"Category '{slug}' must have 'chats' field"
+def test_yaml_config_loaded_from_file(tmp_path):
+    """Test that a chats.yaml file is parsed through load_chats_config."""
+    path = tmp_path / "chats.yaml"
+    path.write_text(
+        "settings:\n  parse_days: 2\nchats:\n  - alpha\n  - -100123\n",
+        encoding="utf-8",
+    )
 
-        # Verify the number of categories matches
-        assert len(result["categories"]) == len(categories), (
-            "Number of categories must match input"
-        )
+    result = load_chats_config(path)
 
-    finally:
-        # Cleanup
-        Path(temp_path).unlink(missing_ok=True)
+    assert result == {"settings": {"parse_days": 2}, "chats": ["alpha", -100123]}
 
 
 def test_yaml_config_missing_file_raises_error():
@@ -95,58 +82,15 @@ def test_yaml_config_missing_file_raises_error():
         load_chats_config("nonexistent/path/config.yaml")
 
 
-def test_yaml_config_missing_categories_key_raises_error():
-    """Test that config without 'categories' key raises ValueError."""
-    with tempfile.NamedTemporaryFile(
-        mode="w", suffix=".yaml", delete=False, encoding="utf-8"
-    ) as f:
-        yaml.safe_dump({"other_key": "value"}, f)
-        temp_path = f.name
-
-    try:
-        with pytest.raises(ValueError, match="must contain 'categories' key"):
-            load_chats_config(temp_path)
-    finally:
-        Path(temp_path).unlink(missing_ok=True)
-
-
-def test_yaml_config_category_missing_name_raises_error():
-    """Test that category without 'name' field raises ValueError."""
-    config = {
-        "categories": {
-            "test_cat": {"chats": ["@test_chat"]}
-        }
-    }
-
-    with tempfile.NamedTemporaryFile(
-        mode="w", suffix=".yaml", delete=False, encoding="utf-8"
-    ) as f:
-        yaml.safe_dump(config, f)
-        temp_path = f.name
-
-    try:
-        with pytest.raises(ValueError, match="must have 'name' field"):
-            load_chats_config(temp_path)
-    finally:
-        Path(temp_path).unlink(missing_ok=True)
-
-
-def test_yaml_config_category_missing_chats_raises_error():
-    """Test that category without 'chats' field raises ValueError."""
-    config = {
-        "categories": {
-            "test_cat": {"name": "Test Category"}
-        }
-    }
-
-    with tempfile.NamedTemporaryFile(
-        mode="w", suffix=".yaml", delete=False, encoding="utf-8"
-    ) as f:
-        yaml.safe_dump(config, f)
-        temp_path = f.name
-
-    try:
-        with pytest.raises(ValueError, match="must have 'chats' field"):
-            load_chats_config(temp_path)
-    finally:
-        Path(temp_path).unlink(missing_ok=True)
+def test_yaml_config_missing_chats_key_raises_error():
+    """Test that config without 'chats' key raises ValueError."""
+    text = yaml.dump({"settings": {"parse_days": 2}}, Dumper=YamlDumper)
+
+    with pytest.raises(ValueError, match="must contain 'chats' key"):
+        load_chats_config_from_stream(text)
+
+
+def test_yaml_config_empty_file_raises_error():
+    """Test that an empty config raises ValueError."""
+    with pytest.raises(ValueError, match="Configuration file is empty"):
+        load_chats_config_from_stream("")
@@ -0,0 +1,91 @@
+"""Tests for the chat config cache.
+
+Checks that unchanged files are served from the cache and that rewrites
+and clear_chats_config_cache() force a fresh parse.
+"""
+
+import os
+
+import pytest
+
+from core.config import clear_chats_config_cache, load_chats_config
+
+
+def write_links(path, usernames: list[str]) -> None:
+    """Write a crypto.txt-style list of t.me links."""
+    path.write_text(
+        "".join(f"https://t.me/{name}\n" for name in usernames),
+        encoding="utf-8",
+    )
+
+
+@pytest.fixture(autouse=True)
+def clean_cache(tmp_path, monkeypatch):
+    """Run each test in an empty directory with an empty config cache."""
+    monkeypatch.chdir(tmp_path)
+    clear_chats_config_cache()
+    yield
+    clear_chats_config_cache()
+
+
+def test_unchanged_file_is_served_from_cache(tmp_path):
+    """Loading an unchanged file twice SHALL return the cached config."""
+    write_links(tmp_path / "crypto.txt", ["alpha", "beta"])
+
+    first = load_chats_config()
+    second = load_chats_config()
+
+    assert first["chats"] == ["alpha", "beta"]
+    assert second is first
+
+
+def test_rewritten_file_is_parsed_again(tmp_path):
+    """A rewrite with a different size SHALL invalidate the cached config."""
+    path = tmp_path / "crypto.txt"
+    write_links(path, ["alpha"])
+    first = load_chats_config()
+
+    write_links(path, ["alpha", "gamma"])
+    second = load_chats_config()
+
+    assert second is not first
+    assert second["chats"] == ["alpha", "gamma"]
+
+
+def test_same_size_rewrite_with_new_mtime_is_parsed_again(tmp_path):
+    """A same-size rewrite SHALL be picked up through its modification time."""
+    path = tmp_path / "crypto.txt"
+    write_links(path, ["alpha"])
+    stat = path.stat()
+    first = load_chats_config()
+
+    write_links(path, ["omega"])
+    os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+    second = load_chats_config()
+
+    assert second["chats"] == ["omega"]
+    assert first["chats"] == ["alpha"]
+
+
+def test_clear_cache_forces_reparse(tmp_path):
+    """clear_chats_config_cache() SHALL make the next load re-read the file."""
+    write_links(tmp_path / "crypto.txt", ["alpha"])
+    first = load_chats_config()
+
+    clear_chats_config_cache()
+    second = load_chats_config()
+
+    assert second is not first
+    assert second == first
+
+
+def test_yaml_config_is_cached(tmp_path):
+    """The YAML fallback SHALL be cached the same way as crypto.txt."""
+    path = tmp_path / "chats.yaml"
+    path.write_text("chats:\n  - alpha\n", encoding="utf-8")
+
+    first = load_chats_config(path)
+    second = load_chats_config(path)
+
+    assert first["chats"] == ["alpha"]
+    assert second is first
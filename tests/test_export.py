@@ -0,0 +1,102 @@
+"""Property-based tests for export file writing.
+
+Tests the streamed JSON layout, size/checksum metadata and TTL cleanup
+using hypothesis.
+"""
+
+import hashlib
+import json
+import os
+import tempfile
+import time
+from datetime import datetime
+from pathlib import Path
+from types import SimpleNamespace
+from unittest.mock import patch
+
+import pytest
+from hypothesis import given, strategies as st
+
+from core.export import ExportWriter, remove_old_exports
+
+
+STARTED_AT = datetime(2025, 1, 21, 12, 0, 0)
+
+MESSAGE_STRATEGY = st.fixed_dictionaries({
+    "chat": st.text(min_size=1, max_size=30),
+    "message_id": st.integers(min_value=1, max_value=10**9),
+    "text": st.text(max_size=200),
+    "sender_username": st.one_of(st.none(), st.text(max_size=30)),
+})
+
+# Messages grouped the way ExportWriter receives them: one list per chat
+CHATS_STRATEGY = st.lists(st.lists(MESSAGE_STRATEGY, max_size=10), max_size=5)
+
+
+def export_settings(export_dir: str, ttl_days: int = 7) -> SimpleNamespace:
+    """Settings stand-in with only the fields core.export reads."""
+    return SimpleNamespace(EXPORT_DIR=export_dir, EXPORT_TTL_DAYS=ttl_days)
+
+
+@given(chats=CHATS_STRATEGY, parse_days=st.integers(min_value=1, max_value=30))
+def test_export_round_trip(chats: list[list[dict]], parse_days: int):
+    """
+    *For any* messages written chat by chat, the export file SHALL parse as
+    JSON with the header, all messages in order and the trailer, and the
+    returned size and sha256 SHALL match the file on disk.
+    """
+    messages = [message for chat in chats for message in chat]
+
+    with tempfile.TemporaryDirectory() as export_dir, patch(
+        "core.export.get_settings", return_value=export_settings(export_dir)
+    ):
+        with ExportWriter(1, STARTED_AT, {"parse_days": parse_days}) as writer:
+            for chat in chats:
+                writer.write_messages(chat)
+            export = writer.finish({"messages_count": writer.messages_count})
+
+        data = export.path.read_bytes()
+
+    assert json.loads(data) == {
+        "parse_days": parse_days,
+        "messages": messages,
+        "messages_count": len(messages),
+    }
+    assert export.size == len(data)
+    assert export.sha256 == hashlib.sha256(data).hexdigest()
+
+
+def test_export_removed_on_error():
+    """A writer left by an exception SHALL not leave a partial file behind."""
+    with tempfile.TemporaryDirectory() as export_dir, patch(
+        "core.export.get_settings", return_value=export_settings(export_dir)
+    ):
+        with pytest.raises(RuntimeError):
+            with ExportWriter(1, STARTED_AT, {"parse_days": 2}) as writer:
+                writer.write_messages([{"text": "partial"}])
+                raise RuntimeError("parse failed")
+
+        assert not writer.path.exists()
+
+
+def test_remove_old_exports_keeps_current_and_recent_files():
+    """Exports older than the TTL SHALL be removed, except `keep`."""
+    with tempfile.TemporaryDirectory() as export_dir, patch(
+        "core.export.get_settings", return_value=export_settings(export_dir, ttl_days=7)
+    ):
+        old_time = time.time() - 8 * 86400
+        paths = {
+            name: Path(export_dir, f"crypto_{name}.json")
+            for name in ("old", "kept", "recent")
+        }
+        for path in paths.values():
+            path.write_text("{}")
+        for name in ("old", "kept"):
+            os.utime(paths[name], (old_time, old_time))
+
+        removed = remove_old_exports(paths["kept"])
+
+        assert removed == 1
+        assert not paths["old"].exists()
+        assert paths["kept"].exists()
+        assert paths["recent"].exists()
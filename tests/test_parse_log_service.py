@@ -0,0 +1,100 @@
+"""Tests for the cached latest-parse-log lookups.
+
+Checks cache hits, TTL expiry, clear_parse_log_cache() and updates
+through remember_parse_log() against an in-memory SQLite database.
+"""
+
+import time
+from datetime import datetime, timedelta
+from unittest.mock import patch
+
+import pytest
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
+
+from core.models import Base, ParseLog
+from services.parse_log_service import (
+    LATEST_LOG_TTL_SEC,
+    ParseLogService,
+    clear_parse_log_cache,
+    remember_parse_log,
+)
+
+STARTED_AT = datetime(2025, 1, 21, 12, 0, 0)
+
+
+@pytest.fixture(autouse=True)
+def clean_cache():
+    """Start and finish every test with an empty snapshot cache."""
+    clear_parse_log_cache()
+    yield
+    clear_parse_log_cache()
+
+
+async def make_session_factory() -> async_sessionmaker[AsyncSession]:
+    """Create a fresh in-memory database with the schema."""
+    engine = create_async_engine("sqlite+aiosqlite:///:memory:")
+    async with engine.begin() as conn:
+        await conn.run_sync(Base.metadata.create_all)
+    return async_sessionmaker(engine, expire_on_commit=False)
+
+
+async def add_log(session: AsyncSession, minutes: int, **fields) -> ParseLog:
+    """Commit a parse log started `minutes` after STARTED_AT."""
+    log = ParseLog(started_at=STARTED_AT + timedelta(minutes=minutes), **fields)
+    session.add(log)
+    await session.commit()
+    return log
+
+
+async def test_latest_log_is_served_from_cache():
+    """A second lookup within the TTL SHALL not see newer rows."""
+    session_factory = await make_session_factory()
+    async with session_factory() as session:
+        first = await add_log(session, 0, status="success", json_path="a.json")
+        service = ParseLogService(session)
+        assert (await service.get_latest()).id == first.id
+
+        await add_log(session, 1, status="running")
+        assert (await service.get_latest()).id == first.id
+
+
+async def test_clear_cache_forces_database_read():
+    """clear_parse_log_cache() SHALL make the next lookup hit the database."""
+    session_factory = await make_session_factory()
+    async with session_factory() as session:
+        await add_log(session, 0, status="success", json_path="a.json")
+        service = ParseLogService(session)
+        await service.get_latest()
+
+        newer = await add_log(session, 1, status="running")
+        clear_parse_log_cache()
+        assert (await service.get_latest()).id == newer.id
+
+
+async def test_cached_log_expires_after_ttl():
+    """After LATEST_LOG_TTL_SEC a lookup SHALL re-read the database."""
+    session_factory = await make_session_factory()
+    async with session_factory() as session:
+        await add_log(session, 0, status="success", json_path="a.json")
+        service = ParseLogService(session)
+        await service.get_latest()
+
+        newer = await add_log(session, 1, status="running")
+        later = time.monotonic() + LATEST_LOG_TTL_SEC + 1
+        with patch("services.parse_log_service.time.monotonic", return_value=later):
+            assert (await service.get_latest()).id == newer.id
+
+
+async def test_remember_failed_log_keeps_last_successful_export():
+    """A failed run SHALL become the latest log but not the latest export."""
+    session_factory = await make_session_factory()
+    async with session_factory() as session:
+        success = await add_log(session, 0, status="success", json_path="a.json")
+        remember_parse_log(success)
+
+        failed = await add_log(session, 1, status="failed")
+        remember_parse_log(failed)
+
+        service = ParseLogService(session)
+        assert (await service.get_latest()).id == failed.id
+        assert (await service.get_latest(success_only=True)).id == success.id
@@ -0,0 +1,49 @@
+"""Property-based tests for the async rate limiter.
+
+Tests token-bucket burst and refill behaviour using hypothesis.
+"""
+
+import asyncio
+import time
+
+import pytest
+from hypothesis import given, strategies as st
+
+from core.ratelimit import AsyncRateLimiter
+
+
+@given(rate=st.integers(min_value=1, max_value=50))
+async def test_rate_limiter_allows_full_burst(rate: int):
+    """A fresh limiter SHALL grant `rate` tokens without waiting."""
+    limiter = AsyncRateLimiter(rate, period=60.0)
+    started = time.monotonic()
+    for _ in range(rate):
+        async with limiter:
+            pass
+    assert time.monotonic() - started < 0.5
+
+
+async def test_rate_limiter_waits_for_refill():
+    """Acquiring past the burst SHALL wait roughly one token interval."""
+    limiter = AsyncRateLimiter(2, period=0.2)
+    await limiter.acquire()
+    await limiter.acquire()
+    started = time.monotonic()
+    await limiter.acquire()
+    assert time.monotonic() - started >= 0.08
+
+
+async def test_rate_limiter_supports_fractional_rate():
+    """A rate below one token per period SHALL still grant tokens, spaced out."""
+    limiter = AsyncRateLimiter(0.5, period=0.1)
+    started = time.monotonic()
+    await asyncio.wait_for(limiter.acquire(), timeout=1.0)
+    assert time.monotonic() - started < 0.05
+    await asyncio.wait_for(limiter.acquire(), timeout=1.0)
+    assert time.monotonic() - started >= 0.15
+
+
+def test_rate_limiter_rejects_non_positive_rate():
+    """Test that a zero rate raises ValueError."""
+    with pytest.raises(ValueError):
+        AsyncRateLimiter(0)
@@ -0,0 +1,57 @@
+"""Property-based tests for the bounded FSM storage.
+
+Tests LRU eviction and read-without-insert behaviour using hypothesis.
+"""
+
+import pytest
+from aiogram.fsm.storage.base import StorageKey
+from hypothesis import given, strategies as st
+
+from bot.storage import LRUMemoryStorage
+
+
+def make_key(user_id: int) -> StorageKey:
+    """Build a storage key for a private chat with the user."""
+    return StorageKey(bot_id=1, chat_id=user_id, user_id=user_id)
+
+
+@given(
+    maxsize=st.integers(min_value=1, max_value=20),
+    user_ids=st.lists(st.integers(min_value=1, max_value=100), max_size=60),
+)
+async def test_storage_never_exceeds_maxsize(maxsize: int, user_ids: list[int]):
+    """Storage SHALL keep at most `maxsize` records and the newest ones."""
+    storage = LRUMemoryStorage(maxsize)
+    for user_id in user_ids:
+        await storage.set_state(make_key(user_id), "state")
+
+    assert len(storage.storage) <= maxsize
+    if user_ids:
+        assert await storage.get_state(make_key(user_ids[-1])) == "state"
+
+
+async def test_storage_keeps_recently_read_records():
+    """Reading a record SHALL protect it from the next eviction."""
+    storage = LRUMemoryStorage(2)
+    await storage.set_data(make_key(1), {"a": 1})
+    await storage.set_data(make_key(2), {"b": 2})
+
+    assert await storage.get_data(make_key(1)) == {"a": 1}
+    await storage.set_data(make_key(3), {"c": 3})
+
+    assert await storage.get_data(make_key(1)) == {"a": 1}
+    assert await storage.get_data(make_key(2)) == {}
+
+
+async def test_storage_reads_do_not_create_records():
+    """Reading unknown keys SHALL not grow the storage."""
+    storage = LRUMemoryStorage(10)
+    assert await storage.get_state(make_key(1)) is None
+    assert await storage.get_value(make_key(1), "x", 5) == 5
+    assert len(storage.storage) == 0
+
+
+def test_storage_rejects_non_positive_maxsize():
+    """Test that a zero maxsize raises ValueError."""
+    with pytest.raises(ValueError):
+        LRUMemoryStorage(0)
@@ -0,0 +1,96 @@
+"""Parse run shared by the scheduled job and the bot's manual parse.
+
+Parses every configured chat into an export file and records the
+outcome on the run's ParseLog.
+"""
+
+import asyncio
+import logging
+from contextlib import aclosing
+from datetime import datetime
+
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from core.config import load_chats_config
+from core.export import ExportFile, ExportWriter, remove_old_exports
+from core.models import ParseLog, utcnow
+from worker.jobs.parser import ChatParser
+from worker.telethon_client import get_telethon_client
+
+logger = logging.getLogger(__name__)
+
+
+async def run_parse_into_export(session: AsyncSession, log: ParseLog) -> ExportFile:
+    """Parse all configured chats into an export and finish the parse log.
+
+    On success the log is committed with status "success" and the export
+    metadata, then exports older than EXPORT_TTL_DAYS are removed. On
+    failure the log is committed with status "failed", the counts reached
+    so far and the error, and the exception is re-raised.
+
+    Args:
+        session: Session the log belongs to.
+        log: Committed ParseLog in "running" state.
+
+    Returns:
+        Metadata of the written export file.
+    """
+    total_chats = 0
+    total_messages = 0
+
+    try:
+        config = load_chats_config()
+        chat_ids = config.get("chats", [])
+        parse_days = config.get("settings", {}).get("parse_days", 2)
+
+        if not chat_ids:
+            raise ValueError("No chats configured")
+
+        client = await get_telethon_client()
+        parser = ChatParser(client)
+
+        total_chats = len(chat_ids)
+        header = {
+            "parsed_at": datetime.now().isoformat(),
+            "parse_days": parse_days,
+        }
+
+        # Stream each chat's messages to disk as soon as it is parsed;
+        # blocking writes run in a thread to keep the event loop free.
+        # aclosing() cancels the chats still in flight if a write fails
+        with ExportWriter(log.id, log.started_at, header) as writer:
+            async with aclosing(parser.iter_chats(chat_ids, days=parse_days)) as chats:
+                async for _, chat_messages in chats:
+                    await asyncio.to_thread(writer.write_messages, chat_messages)
+                    total_messages = writer.messages_count
+            export = await asyncio.to_thread(
+                writer.finish,
+                {"chats_count": total_chats, "messages_count": total_messages},
+            )
+
+        log.finished_at = utcnow()
+        log.status = "success"
+        log.chats_parsed = total_chats
+        log.messages_found = total_messages
+        log.json_path = str(export.path)
+        log.json_size = export.size
+        log.json_sha256 = export.sha256
+        await session.commit()
+
+    except Exception as e:
+        logger.error(f"Parsing run failed: {e}")
+        log.finished_at = utcnow()
+        log.status = "failed"
+        log.chats_parsed = total_chats
+        log.messages_found = total_messages
+        log.error_message = str(e)
+        await session.commit()
+        raise
+
+    logger.info(f"Saved {total_messages} messages to {export.path}")
+
+    removed = await asyncio.to_thread(remove_old_exports, export.path)
+    if removed:
+        logger.info(f"Removed {removed} old export files")
+
+    return export
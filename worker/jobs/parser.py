@@ -2,16 +2,38 @@
 
 import asyncio
 import logging
+from collections import OrderedDict
 from datetime import datetime, timedelta, timezone
-from typing import Any
+from typing import Any, AsyncIterator
 
 from telethon import TelegramClient
-from telethon.tl.types import User
+from telethon.errors import (
+    ChannelPrivateError,
+    FloodWaitError,
+    UsernameNotOccupiedError,
+)
+from telethon.tl.types import TypeInputPeer, User
 
 from core.config import get_settings
+from worker.telethon_client import get_telethon_limiter
 
 logger = logging.getLogger(__name__)
 
+# Resolved input peers, shared by every ChatParser since the Telethon
+# client is a process-wide singleton. Sized to hold the whole chat list so
+# a full pass does not evict entries before the next run reuses them.
+# Across restarts the session file keeps the access hashes, so a miss here
+# is normally answered from the session without a request.
+ENTITY_CACHE_SIZE = 2048
+_entity_cache: OrderedDict[str, TypeInputPeer] = OrderedDict()
+
+# Page size Telethon uses for GetHistory when iterating messages
+MESSAGES_PER_REQUEST = 100
+
+# Retries for a chat after Telegram asks to wait longer than the client's
+# own flood_sleep_threshold
+FLOOD_WAIT_RETRIES = 1
+
 
 class ChatParser:
     """Parser for retrieving messages from Telegram chats."""
@@ -19,109 +41,167 @@ class ChatParser:
     def __init__(self, client: TelegramClient):
         self.client = client
         self.settings = get_settings()
+        # Chats are parsed concurrently; only one of them may reconnect
+        self._connect_lock = asyncio.Lock()
     
     async def ensure_connected(self):
         """Ensure client is connected, reconnect if needed."""
-        if not self.client.is_connected():
-            logger.info("Reconnecting to Telegram...")
-            await self.client.connect()
-            if not await self.client.is_user_authorized():
-                raise RuntimeError("Telethon not authorized")
+        if self.client.is_connected():
+            return
+        
+        async with self._connect_lock:
+            if not self.client.is_connected():
+                logger.info("Reconnecting to Telegram...")
+                await self.client.connect()
+                if not await self.client.is_user_authorized():
+                    raise RuntimeError("Telethon not authorized")
+    
+    async def get_input_peer(self, chat_id: str) -> TypeInputPeer:
+        """Resolve a chat to an input peer, reusing earlier resolutions.
+
+        Unlike get_entity(), this does not fetch the full chat object:
+        iter_messages only needs the peer, and the chat title arrives
+        with the messages.
+        """
+        peer = _entity_cache.get(chat_id)
+        if peer is not None:
+            _entity_cache.move_to_end(chat_id)
+            return peer
+        
+        async with get_telethon_limiter():
+            peer = await self.client.get_input_entity(chat_id)
+        _entity_cache[chat_id] = peer
+        if len(_entity_cache) > ENTITY_CACHE_SIZE:
+            _entity_cache.popitem(last=False)
+        return peer
     
     async def parse_chat(
         self,
         chat_id: str,
         days: int = 2,
     ) -> list[dict[str, Any]]:
-        """Parse messages from a single chat."""
+        """Parse messages from a single chat.
+
+        A chat that hits a flood wait is retried once after the wait;
+        any other error skips the chat.
+        """
+        for attempt in range(FLOOD_WAIT_RETRIES + 1):
+            try:
+                messages = await self._fetch_chat(chat_id, days)
+            except (ChannelPrivateError, UsernameNotOccupiedError) as e:
+                # The cached peer no longer leads anywhere; resolve it anew
+                # next time in case the chat comes back
+                _entity_cache.pop(chat_id, None)
+                logger.error(f"Error parsing chat {chat_id}: {e}")
+                return []
+            except FloodWaitError as e:
+                if attempt == FLOOD_WAIT_RETRIES:
+                    logger.error(f"Flood wait on {chat_id} persisted, skipping")
+                    return []
+                logger.warning(f"Flood wait {e.seconds}s on {chat_id}, retrying")
+                await asyncio.sleep(e.seconds)
+            except Exception as e:
+                # Other chats share the client, so it is not force-reconnected
+                # here; ensure_connected() restores a dropped connection
+                logger.error(f"Error parsing chat {chat_id}: {e}")
+                return []
+            else:
+                logger.info(f"Parsed {len(messages)} messages from {chat_id}")
+                return messages
+        return []
+    
+    async def _fetch_chat(self, chat_id: str, days: int) -> list[dict[str, Any]]:
+        """Fetch and filter recent messages of a chat, raising on errors."""
         messages = []
-        cutoff_date = datetime.now(timezone.utc) - timedelta(days=days)
+        now = datetime.now(timezone.utc)
+        cutoff_date = now - timedelta(days=days)
         min_length = self.settings.MIN_MESSAGE_LENGTH
+        limiter = get_telethon_limiter()
         
-        try:
-            # Ensure connected before each chat
-            await self.ensure_connected()
+        # Ensure connected before each chat
+        await self.ensure_connected()
+        
+        peer = await self.get_input_peer(chat_id)
+        chat_title = None
+        
+        # iter_messages sends one GetHistory request per page: take a token
+        # for the first page here and for each later one when a page is used up
+        await limiter.acquire()
+        fetched = 0
+        async for message in self.client.iter_messages(
+            peer,
+            offset_date=now,
+            reverse=False,
+            # Pacing comes from the limiter, not Telethon's own page delay
+            wait_time=0,
+        ):
+            if message.date < cutoff_date:
+                break
             
-            entity = await self.client.get_entity(chat_id)
-            chat_title = getattr(entity, 'title', chat_id)
+            fetched += 1
+            if fetched % MESSAGES_PER_REQUEST == 0:
+                await limiter.acquire()
             
-            async for message in self.client.iter_messages(
-                entity,
-                offset_date=datetime.now(timezone.utc),
-                reverse=False,
-            ):
-                if message.date < cutoff_date:
-                    break
-                
-                if not message.text or len(message.text) < min_length:
-                    continue
-                
-                sender_name = None
-                sender_username = None
-                is_bot = False
-                
-                if message.sender:
-                    if isinstance(message.sender, User):
-                        is_bot = message.sender.bot or False
-                        sender_name = f"{message.sender.first_name or ''} {message.sender.last_name or ''}".strip()
-                        sender_username = message.sender.username
-                
-                if is_bot:
+            text = message.text
+            if not text or len(text) < min_length:
+                continue
+            
+            sender_name = None
+            sender_username = None
+            
+            sender = message.sender
+            if isinstance(sender, User):
+                # Check for bots before building the sender fields
+                if sender.bot:
                     continue
-                
-                messages.append({
-                    "chat": chat_id,
-                    "chat_title": chat_title,
-                    "message_id": message.id,
-                    "date": message.date.isoformat(),
-                    "text": message.text,
-                    "sender_name": sender_name,
-                    "sender_username": sender_username,
-                })
+                sender_name = f"{sender.first_name or ''} {sender.last_name or ''}".strip()
+                sender_username = sender.username
             
-            logger.info(f"Parsed {len(messages)} messages from {chat_id}")
+            if chat_title is None:
+                chat_title = getattr(message.chat, 'title', None) or chat_id
             
-        except Exception as e:
-            logger.error(f"Error parsing chat {chat_id}: {e}")
-            # Try to reconnect for next chat
-            try:
-                await self.client.disconnect()
-                await asyncio.sleep(2)
-                await self.client.connect()
-            except:
-                pass
-            return []
+            messages.append({
+                "chat": chat_id,
+                "chat_title": chat_title,
+                "message_id": message.id,
+                "date": message.date.isoformat(),
+                "text": text,
+                "sender_name": sender_name,
+                "sender_username": sender_username,
+            })
         
         return messages
     
-    async def parse_all_chats(
+    async def iter_chats(
         self,
         chat_ids: list[str],
         days: int = 2,
-    ) -> list[dict[str, Any]]:
-        """Parse messages from all chats."""
-        all_messages = []
-        delay = self.settings.REQUEST_DELAY_SEC
-        
-        for i, chat_id in enumerate(chat_ids):
-            if i > 0:
-                await asyncio.sleep(delay)
-            
-            # Reconnect every 100 chats to avoid disconnection
-            if i > 0 and i % 100 == 0:
-                logger.info(f"Reconnecting after {i} chats...")
-                try:
-                    await self.client.disconnect()
-                    await asyncio.sleep(3)
-                    await self.client.connect()
-                except Exception as e:
-                    logger.error(f"Reconnect failed: {e}")
-            
-            logger.info(f"Parsing chat {i + 1}/{len(chat_ids)}: {chat_id}")
-            messages = await self.parse_chat(chat_id, days)
-            all_messages.extend(messages)
+    ) -> AsyncIterator[tuple[str, list[dict[str, Any]]]]:
+        """Parse chats concurrently, yielding (chat_id, messages) per chat.
+
+        Up to PARSE_CONCURRENCY chats are fetched at once and results are
+        yielded as each chat finishes, so the order is not that of
+        chat_ids. Lets callers write results out as they arrive instead
+        of holding every message of the run in memory.
+        """
+        semaphore = asyncio.Semaphore(self.settings.PARSE_CONCURRENCY)
+        total = len(chat_ids)
         
-        all_messages.sort(key=lambda x: x["date"], reverse=True)
+        async def parse_one(i: int, chat_id: str) -> tuple[str, list[dict[str, Any]]]:
+            async with semaphore:
+                logger.info(f"Parsing chat {i + 1}/{total}: {chat_id}")
+                return chat_id, await self.parse_chat(chat_id, days)
         
-        logger.info(f"Total: {len(all_messages)} messages from {len(chat_ids)} chats")
-        return all_messages
+        tasks = [
+            asyncio.create_task(parse_one(i, chat_id))
+            for i, chat_id in enumerate(chat_ids)
+        ]
+        try:
+            for next_done in asyncio.as_completed(tasks):
+                yield await next_done
+        finally:
+            # Stop outstanding chats if the caller gives up early and wait
+            # for them, so none keep using the client after the run is over
+            for task in tasks:
+                task.cancel()
+            await asyncio.gather(*tasks, return_exceptions=True)
@@ -90,4 +90,13 @@ async def main() -> None:
 
 
 if __name__ == "__main__":
+    # libuv-based event loop: cheaper task switching and socket I/O for the
+    # network-bound worker; the default loop is used where it is unavailable
+    try:
+        import uvloop
+    except ImportError:
+        pass
+    else:
+        uvloop.install()
+    
     asyncio.run(main())
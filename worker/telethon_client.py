@@ -1,13 +1,21 @@
 """Telethon client singleton for Telegram chat parsing."""
 
+import asyncio
 from pathlib import Path
 from telethon import TelegramClient
 
 from core.config import get_settings
+from core.ratelimit import AsyncRateLimiter
 
 # Global singleton client
 _telethon_client: TelegramClient | None = None
 
+# Guards creation and connection so concurrent callers share one handshake
+_telethon_lock = asyncio.Lock()
+
+# Token bucket shared by every request sent through the client
+_telethon_limiter: AsyncRateLimiter | None = None
+
 # Session file name (without .session extension)
 SESSION_NAME = "crypto_parser"
 
@@ -15,26 +23,34 @@ SESSION_NAME = "crypto_parser"
 async def get_telethon_client() -> TelegramClient:
     """Get or create the singleton Telethon client.
     
-    Uses file-based session (crypto_parser.session).
+    Uses file-based session (crypto_parser.session). The client is connected
+    once and reused by every parsing run in the process.
     """
     global _telethon_client
     
-    if _telethon_client is None:
-        settings = get_settings()
-        
-        _telethon_client = TelegramClient(
-            SESSION_NAME,
-            settings.TELEGRAM_API_ID,
-            settings.TELEGRAM_API_HASH,
-        )
+    # Fast path: already connected, no need to wait for the lock
+    if _telethon_client is not None and _telethon_client.is_connected():
+        return _telethon_client
     
-    if not _telethon_client.is_connected():
-        await _telethon_client.connect()
-        
-        if not await _telethon_client.is_user_authorized():
-            raise RuntimeError(
-                "Telethon not authorized. Run auth_telethon.py locally first."
+    async with _telethon_lock:
+        if _telethon_client is None:
+            settings = get_settings()
+            
+            _telethon_client = TelegramClient(
+                SESSION_NAME,
+                settings.TELEGRAM_API_ID,
+                settings.TELEGRAM_API_HASH,
             )
+        
+        if not _telethon_client.is_connected():
+            await _telethon_client.connect()
+            
+            if not await _telethon_client.is_user_authorized():
+                # Do not leave an unusable client behind the fast path
+                await _telethon_client.disconnect()
+                raise RuntimeError(
+                    "Telethon not authorized. Run auth_telethon.py locally first."
+                )
     
     return _telethon_client
 
@@ -46,3 +62,19 @@ async def close_telethon_client() -> None:
     if _telethon_client is not None:
         await _telethon_client.disconnect()
         _telethon_client = None
+
+
+def get_telethon_limiter() -> AsyncRateLimiter:
+    """Get the rate limiter for Telethon requests.
+    
+    A single bucket bounds the request rate of the whole process, however
+    many chats are being parsed at once.
+    """
+    global _telethon_limiter
+    
+    if _telethon_limiter is None:
+        _telethon_limiter = AsyncRateLimiter(
+            get_settings().TELEGRAM_REQUESTS_PER_SEC
+        )
+    
+    return _telethon_limiter